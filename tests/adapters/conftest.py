@@ -0,0 +1,57 @@
+"""
+Adapters tests configuration and fixtures.
+
+This module provides shared database fixtures for the repository adapter tests.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.adapters.database.models import Base
+
+from ..conftest import make_test_engine
+
+
+@pytest.fixture(scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create the in-memory test engine and its schema once per test session.
+
+    Yields:
+        AsyncEngine: Engine with all tables created
+    """
+    test_engine = make_test_engine()
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield test_engine
+
+    await test_engine.dispose()
+
+
+@pytest.fixture
+async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session whose changes are rolled back after each test.
+
+    The session joins an outer transaction through a SAVEPOINT, so calls to
+    ``session.commit()`` inside a test never reach the shared database.
+
+    Yields:
+        AsyncSession: Test database session
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
@@ -0,0 +1,19 @@
+"""
+Tests for PasslibPasswordHasher - bcrypt implementation of PasswordHasherPort.
+
+The integration tests swap in a cheap hasher, so the real one is covered here.
+"""
+
+from src.adapters.security.hashing import PasslibPasswordHasher
+
+
+def test_hash_and_verify_round_trip() -> None:
+    """Test a hash verifies against its own password and no other."""
+
+    hasher = PasslibPasswordHasher()
+
+    hashed = hasher.hash("password123")
+
+    assert hashed != "password123"
+    assert hasher.verify("password123", hashed)
+    assert not hasher.verify("wrongpassword", hashed)
@@ -3,8 +3,10 @@ import pytest
 from src.adapters.external.sptrans_adapter import SpTransAdapter
 from src.core.models.bus import BusPosition, BusRoute
 
+# These tests hit the live SPTrans API, so they only run when selected explicitly
+pytestmark = pytest.mark.slow
+
 
-@pytest.mark.asyncio
 async def test_automatic_authentication() -> None:
     """
     Test that the adapter authenticates automatically when making requests.
@@ -17,7 +19,6 @@ async def test_automatic_authentication() -> None:
     assert len(routes) > 0
 
 
-@pytest.mark.asyncio
 async def test_search_routes_number() -> None:
     """
     Searches for route number and validates the results.
@@ -35,7 +36,6 @@ async def test_search_routes_number() -> None:
         assert "8075" in bus_route.route.bus_line
 
 
-@pytest.mark.asyncio
 async def test_search_routes_by_destination() -> None:
     """
     Searches for routes by destination name.
@@ -48,7 +48,6 @@ async def test_search_routes_by_destination() -> None:
     assert len(bus_routes) > 0, "Nenhuma rota retornada para Lapa"
 
 
-@pytest.mark.asyncio
 async def test_get_bus_positions() -> None:
     """
     Fetches real-time positions for route 8075.
@@ -73,7 +72,6 @@ async def test_get_bus_positions() -> None:
         assert isinstance(pos.position.longitude, float | int)
 
 
-@pytest.mark.asyncio
 async def test_search_routes_returns_empty_for_unknown() -> None:
     """
     Test that search returns empty list for unknown routes.
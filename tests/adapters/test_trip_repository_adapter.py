@@ -1,32 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
-import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
-from src.adapters.database.connection import engine
 from src.core.models.bus import RouteIdentifier
 from src.core.models.trip import Trip as DomainTrip
 
 
-@pytest.fixture(scope="function")
-async def db_session_transactional() -> AsyncGenerator:
-    async with engine.connect() as conn:
-        trans = await conn.begin()
-        try:
-            session_factory = async_sessionmaker(
-                bind=conn, class_=AsyncSession, expire_on_commit=False
-            )
-            async with session_factory() as session:
-                yield session
-        finally:
-            await trans.rollback()
-
-
 def _make_domain_trip() -> object:
     from src.core.models.trip import Trip
 
@@ -39,7 +20,6 @@ def _make_domain_trip() -> object:
     )
 
 
-@pytest.mark.asyncio
 async def test_save_trip_unit(monkeypatch) -> None:
     import importlib
 
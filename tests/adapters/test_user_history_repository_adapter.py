@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Any
 from unittest.mock import AsyncMock
 
-import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from src.adapters.repositories.history_repository_adapter import (
     UserHistoryRepositoryAdapter,
 )
@@ -37,25 +33,6 @@ class _DummyResult:
         return self._value
 
 
-@pytest.fixture(scope="function")
-async def db_session_transactional() -> AsyncGenerator[AsyncSession, None]:
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
-    from src.adapters.database.connection import engine
-
-    async with engine.connect() as conn:
-        trans = await conn.begin()
-        try:
-            session_factory = async_sessionmaker(
-                bind=conn, class_=AsyncSession, expire_on_commit=False
-            )
-            async with session_factory() as session:
-                yield session
-        finally:
-            await trans.rollback()
-
-
-@pytest.mark.asyncio
 async def test_get_user_history_returns_history_using_autospec() -> None:
     session = AsyncMock()
 
@@ -76,7 +53,6 @@ async def test_get_user_history_returns_history_using_autospec() -> None:
     assert history.trips[0].score == 12
 
 
-@pytest.mark.asyncio
 async def test_get_user_history_returns_none_when_missing_or_no_trips() -> None:
     session_none = AsyncMock()
     session_none.execute = AsyncMock(return_value=_DummyResult(None))
@@ -94,7 +70,6 @@ async def test_get_user_history_returns_none_when_missing_or_no_trips() -> None:
     assert history_empty is None
 
 
-@pytest.mark.asyncio
 async def test_get_user_history_with_multiple_trips_returns_all_route_identifiers() -> None:
     session = AsyncMock()
 
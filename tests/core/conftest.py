@@ -0,0 +1,71 @@
+"""
+Core tests configuration and fixtures.
+
+This module provides the port doubles and service factories shared by the
+core service tests.
+"""
+
+from collections.abc import Callable
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.ports.bus_provider_port import BusProviderPort
+from src.core.ports.gtfs_repository import GTFSRepositoryPort
+from src.core.ports.password_hasher import PasswordHasherPort
+from src.core.ports.trip_repository import TripRepository
+from src.core.ports.user_repository import UserRepository
+from src.core.services.route_service import RouteService
+from src.core.services.trip_service import TripService
+
+
+@pytest.fixture
+def bus_provider() -> Mock:
+    """Bus provider double; the spec exposes coroutine methods as AsyncMock."""
+    return Mock(spec=BusProviderPort)
+
+
+@pytest.fixture
+def gtfs_repo() -> Mock:
+    """GTFS repository double."""
+    return Mock(spec=GTFSRepositoryPort)
+
+
+@pytest.fixture
+def user_repo() -> Mock:
+    """User repository double; the spec exposes coroutine methods as AsyncMock."""
+    return Mock(spec=UserRepository)
+
+
+@pytest.fixture
+def trip_repo() -> Mock:
+    """Trip repository double; the spec exposes coroutine methods as AsyncMock."""
+    return Mock(spec=TripRepository)
+
+
+@pytest.fixture
+def password_hasher() -> Mock:
+    """Password hasher double."""
+    return Mock(spec=PasswordHasherPort)
+
+
+@pytest.fixture
+def route_service(bus_provider: Mock, gtfs_repo: Mock) -> RouteService:
+    """RouteService wired to the bus provider and GTFS repository doubles."""
+    return RouteService(bus_provider, gtfs_repo)
+
+
+@pytest.fixture
+def make_service(gtfs_repo: Mock) -> Callable[[BusProviderPort], RouteService]:
+    """Build a RouteService around a test-specific bus provider."""
+
+    def _make_service(bus_provider: BusProviderPort) -> RouteService:
+        return RouteService(bus_provider=bus_provider, gtfs_repository=gtfs_repo)
+
+    return _make_service
+
+
+@pytest.fixture
+def trip_service(trip_repo: Mock, user_repo: Mock) -> TripService:
+    """TripService wired to the trip and user repository doubles."""
+    return TripService(trip_repo, user_repo)
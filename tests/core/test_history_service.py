@@ -1,156 +1,89 @@
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, create_autospec
+from functools import cache
 
 import pytest
 
-from src.core.models.bus import RouteIdentifier
+from src.core.models.bus import BusDirection, RouteIdentifier
 from src.core.models.trip import Trip
 from src.core.models.user_history import HistoryEntry, UserHistory
-from src.core.ports.history_repository import UserHistoryRepository
 from src.core.services.history_service import HistoryService
 
+EMAIL = "user@example.com"
 
-@pytest.mark.asyncio
-async def test_get_user_history_timezone_aware() -> None:
-    history_repo = create_autospec(UserHistoryRepository, instance=True)
+TRIP1 = datetime(2025, 10, 16, 10, 0, 0)
+TRIP2 = datetime(2025, 10, 17, 14, 30, 0)
+TRIP3 = datetime(2025, 10, 18, 8, 15, 0)
+TRIP_UTC = datetime(2025, 10, 16, 10, 0, 0, tzinfo=UTC)
 
-    trip_datetime = datetime(2025, 10, 16, 10, 0, 0, tzinfo=UTC)
-    trip = Trip(
-        email="tz@example.com",
-        route=RouteIdentifier(bus_line="8000", bus_direction=1),
-        distance=1000,
-        score=10,
-        trip_datetime=trip_datetime,
-    )
-
-    user_history = UserHistory(email="tz@example.com", trips=[trip])
-
-    history_repo.get_user_history = AsyncMock(return_value=user_history)
-
-    service = HistoryService(history_repo)
-
-    result = await service.get_user_history("tz@example.com")
 
-    assert len(result) == 1
-    assert result[0].date == trip_datetime
-    assert result[0].score == 10
-    assert result[0].route.bus_line == "8000"
-    assert result[0].route.bus_direction == 1
-    history_repo.get_user_history.assert_awaited_once_with("tz@example.com")
+class _StubHistoryRepo:
+    """Minimal stand-in for UserHistoryRepository exposing only get_user_history."""
 
+    def __init__(self, history: UserHistory | None) -> None:
+        self.calls: list[str] = []
+        self._history = history
 
-@pytest.mark.asyncio
-async def test_get_user_history_no_data() -> None:
-    history_repo = create_autospec(UserHistoryRepository, instance=True)
-    history_repo.get_user_history = AsyncMock(return_value=None)
+    async def get_user_history(self, email: str) -> UserHistory | None:
+        self.calls.append(email)
+        return self._history
 
-    service = HistoryService(history_repo)
 
-    result = await service.get_user_history("noone@example.com")
+@cache
+def _route(bus_line: str, bus_direction: BusDirection) -> RouteIdentifier:
+    return RouteIdentifier(bus_line=bus_line, bus_direction=bus_direction)
 
-    assert result == []
-    history_repo.get_user_history.assert_awaited_once_with("noone@example.com")
 
-
-@pytest.mark.asyncio
-async def test_get_user_history_single_entry() -> None:
-    history_repo = create_autospec(UserHistoryRepository, instance=True)
-
-    trip_datetime = datetime(2025, 10, 16, 10, 0, 0)
-    trip = Trip(
-        email="test@example.com",
-        route=RouteIdentifier(bus_line="8000", bus_direction=1),
-        distance=1000,
-        score=10,
+def _trip(bus_line: str, bus_direction: BusDirection, score: int, trip_datetime: datetime) -> Trip:
+    return Trip(
+        email=EMAIL,
+        route=_route(bus_line, bus_direction),
+        distance=score * 100,
+        score=score,
         trip_datetime=trip_datetime,
     )
 
-    user_history = UserHistory(email="test@example.com", trips=[trip])
-
-    history_repo.get_user_history = AsyncMock(return_value=user_history)
 
-    service = HistoryService(history_repo)
+def _entry(trip: Trip) -> HistoryEntry:
+    return HistoryEntry(date=trip.trip_datetime, score=trip.score, route=trip.route)
 
-    result = await service.get_user_history("test@example.com")
 
-    assert len(result) == 1
-    assert result[0].date == trip_datetime
-    assert result[0].score == 10
-    assert result[0].route.bus_line == "8000"
-    assert result[0].route.bus_direction == 1
-    history_repo.get_user_history.assert_awaited_once_with("test@example.com")
+_SINGLE_TRIP = _trip("8000", 1, 10, TRIP1)
+_TZ_AWARE_TRIP = _trip("8000", 1, 10, TRIP_UTC)
+_MULTIPLE_TRIPS = [
+    _SINGLE_TRIP,
+    _trip("9000", 2, 20, TRIP2),
+    _trip("7000", 1, 30, TRIP3),
+]
 
 
-@pytest.mark.asyncio
-async def test_get_user_history_multiple_entries() -> None:
-    history_repo = create_autospec(UserHistoryRepository, instance=True)
-
-    trip1_date = datetime(2025, 10, 16, 10, 0, 0)
-    trip2_date = datetime(2025, 10, 17, 14, 30, 0)
-    trip3_date = datetime(2025, 10, 18, 8, 15, 0)
-
-    trips = [
-        Trip(
-            email="multi@example.com",
-            route=RouteIdentifier(bus_line="8000", bus_direction=1),
-            distance=1000,
-            score=10,
-            trip_datetime=trip1_date,
+@pytest.mark.parametrize(
+    ("history", "expected"),
+    [
+        pytest.param(None, [], id="no_data"),
+        pytest.param(UserHistory(email=EMAIL, trips=[]), [], id="empty_trips"),
+        pytest.param(
+            UserHistory(email=EMAIL, trips=[_SINGLE_TRIP]),
+            [_entry(_SINGLE_TRIP)],
+            id="single_entry",
         ),
-        Trip(
-            email="multi@example.com",
-            route=RouteIdentifier(bus_line="9000", bus_direction=2),
-            distance=2000,
-            score=20,
-            trip_datetime=trip2_date,
+        pytest.param(
+            UserHistory(email=EMAIL, trips=[_TZ_AWARE_TRIP]),
+            [_entry(_TZ_AWARE_TRIP)],
+            id="timezone_aware",
         ),
-        Trip(
-            email="multi@example.com",
-            route=RouteIdentifier(bus_line="7000", bus_direction=1),
-            distance=3000,
-            score=30,
-            trip_datetime=trip3_date,
+        pytest.param(
+            UserHistory(email=EMAIL, trips=_MULTIPLE_TRIPS),
+            [_entry(trip) for trip in _MULTIPLE_TRIPS],
+            id="multiple_entries",
         ),
-    ]
-
-    user_history = UserHistory(email="multi@example.com", trips=trips)
-
-    history_repo.get_user_history = AsyncMock(return_value=user_history)
-
-    service = HistoryService(history_repo)
-
-    result = await service.get_user_history("multi@example.com")
-
-    assert len(result) == 3
-    assert all(isinstance(entry, HistoryEntry) for entry in result)
-
-    assert result[0].date == trip1_date
-    assert result[0].score == 10
-    assert result[0].route.bus_line == "8000"
-    assert result[0].route.bus_direction == 1
-
-    assert result[1].date == trip2_date
-    assert result[1].score == 20
-    assert result[1].route.bus_line == "9000"
-    assert result[1].route.bus_direction == 2
-
-    assert result[2].date == trip3_date
-    assert result[2].score == 30
-    assert result[2].route.bus_line == "7000"
-    assert result[2].route.bus_direction == 1
-
-
-@pytest.mark.asyncio
-async def test_get_user_history_empty_trips() -> None:
-    history_repo = create_autospec(UserHistoryRepository, instance=True)
-
-    user_history = UserHistory(email="empty@example.com", trips=[])
-
-    history_repo.get_user_history = AsyncMock(return_value=user_history)
+    ],
+)
+async def test_get_user_history(history: UserHistory | None, expected: list[HistoryEntry]) -> None:
+    history_repo = _StubHistoryRepo(history)
 
-    service = HistoryService(history_repo)
+    service = HistoryService(history_repo)  # type: ignore[arg-type]
 
-    result = await service.get_user_history("empty@example.com")
+    result = await service.get_user_history(EMAIL)
 
-    assert result == []
-    history_repo.get_user_history.assert_awaited_once_with("empty@example.com")
+    assert result == expected
+    assert history_repo.calls == [EMAIL]
@@ -1,354 +1,228 @@
+from collections.abc import Callable, Sequence
+from dataclasses import replace
 from datetime import UTC, datetime
-from typing import cast
-from unittest.mock import AsyncMock, Mock, create_autospec
+from functools import cache
+from unittest.mock import Mock
 
 import pytest
 
-from src.core.models.bus import BusPosition, BusRoute, RouteIdentifier
+from src.core.models.bus import BusDirection, BusPosition, BusRoute, RouteIdentifier
 from src.core.models.coordinate import Coordinate
 from src.core.models.route_shape import RouteShape, RouteShapePoint
 from src.core.ports.bus_provider_port import BusProviderPort
-from src.core.ports.gtfs_repository import GTFSRepositoryPort
 from src.core.services.route_service import RouteService
 
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
-@pytest.mark.asyncio
-async def test_get_bus_positions_calls_provider() -> None:
-    raw_provider: Mock = Mock(spec=BusProviderPort)
-    raw_provider.get_bus_positions = AsyncMock()
 
-    bus_provider: BusProviderPort = cast(BusProviderPort, raw_provider)
+@cache
+def _route(bus_line: str, bus_direction: BusDirection) -> RouteIdentifier:
+    return RouteIdentifier(bus_line=bus_line, bus_direction=bus_direction)
 
-    expected_positions: list[BusPosition] = [
-        BusPosition(
-            route_id=1234,
-            position=Coordinate(latitude=-23.0, longitude=-46.0),
-            time_updated=datetime.now(UTC),
-        ),
-    ]
 
-    raw_provider.get_bus_positions.return_value = expected_positions
+@cache
+def _coordinate(latitude: float, longitude: float) -> Coordinate:
+    return Coordinate(latitude=latitude, longitude=longitude)
 
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-    service: RouteService = RouteService(bus_provider=bus_provider, gtfs_repository=gtfs_repo)
 
-    result: list[BusPosition] = await service.get_bus_positions([1234])
-
-    raw_provider.get_bus_positions.assert_awaited_once_with(1234)
-    assert result == expected_positions
-
-
-@pytest.mark.asyncio
-async def test_search_routes_calls_provider() -> None:
-    raw_provider: Mock = Mock(spec=BusProviderPort)
-    raw_provider.search_routes = AsyncMock()
-
-    bus_provider: BusProviderPort = cast(BusProviderPort, raw_provider)
-
-    route_identifier: RouteIdentifier = RouteIdentifier(
-        bus_line="8075",
-        bus_direction=1,
-    )
-
-    expected_bus_route: BusRoute = BusRoute(
-        route_id=1234,
-        route=route_identifier,
-        is_circular=False,
-        terminal_name="Terminal A",
-    )
-
-    expected_routes: list[BusRoute] = [expected_bus_route]
-
-    raw_provider.search_routes.return_value = expected_routes
-
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-    service: RouteService = RouteService(bus_provider=bus_provider, gtfs_repository=gtfs_repo)
-
-    query = "8075"
-    result: list[BusRoute] = await service.search_routes(query)
-
-    raw_provider.search_routes.assert_awaited_once_with(query)
-    assert result == expected_routes
-
-
-@pytest.mark.asyncio
-async def test_get_bus_positions_propagates_exception_from_provider() -> None:
-    """Test that exceptions from the provider are propagated."""
-    raw_provider: Mock = Mock(spec=BusProviderPort)
-    raw_provider.get_bus_positions = AsyncMock(side_effect=RuntimeError("boom"))
-
-    bus_provider: BusProviderPort = cast(BusProviderPort, raw_provider)
-
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-    service: RouteService = RouteService(bus_provider=bus_provider, gtfs_repository=gtfs_repo)
-
-    with pytest.raises(RuntimeError, match="boom"):
-        await service.get_bus_positions([1234])
-
-    raw_provider.get_bus_positions.assert_awaited_once_with(1234)
-
-
-@pytest.mark.asyncio
-async def test_search_routes_propagates_exception_from_provider() -> None:
-    """Test that exceptions from search_routes are propagated."""
-    raw_provider: Mock = Mock(spec=BusProviderPort)
-    raw_provider.search_routes = AsyncMock(side_effect=RuntimeError("search failed"))
-
-    bus_provider: BusProviderPort = cast(BusProviderPort, raw_provider)
-
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-    service: RouteService = RouteService(bus_provider=bus_provider, gtfs_repository=gtfs_repo)
-
-    with pytest.raises(RuntimeError, match="search failed"):
-        await service.search_routes("8075")
-
-    raw_provider.search_routes.assert_awaited_once_with("8075")
-
-
-def test_get_route_shape_found() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-
-    route = RouteIdentifier(bus_line="1012-10", bus_direction=1)
-
-    # Create a mock route shape
-    mock_shape = RouteShape(
-        route=route,
-        shape_id="84609",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5505, longitude=-46.6333),
-                sequence=1,
-                distance_traveled=0.0,
-            ),
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5510, longitude=-46.6340),
-                sequence=2,
-                distance_traveled=10.5,
-            ),
-        ],
+def _point(
+    latitude: float, longitude: float, sequence: int = 1, distance_traveled: float = 0.0
+) -> RouteShapePoint:
+    return RouteShapePoint(
+        coordinate=_coordinate(latitude, longitude),
+        sequence=sequence,
+        distance_traveled=distance_traveled,
     )
 
-    gtfs_repo.get_route_shape.return_value = mock_shape
-
-    service = RouteService(bus_provider, gtfs_repo)
-
-    # Act
-    result = service.get_route_shapes([route])
-
-    assert result is not None
-    assert len(result) == 1
-    assert result[0].route.bus_line == "1012-10"
-    assert result[0].route.bus_direction == 1
-    assert result[0].shape_id == "84609"
-    assert len(result[0].points) == 2
-    gtfs_repo.get_route_shape.assert_called_once_with(route)
 
+def _shape(
+    bus_line: str, bus_direction: BusDirection, shape_id: str, *points: RouteShapePoint
+) -> RouteShape:
+    return RouteShape(route=_route(bus_line, bus_direction), shape_id=shape_id, points=list(points))
 
-def test_get_route_shape_not_found() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
 
-    route = RouteIdentifier(bus_line="nonexistent-route", bus_direction=1)
+_POINT_A = _point(-23.5505, -46.6333)
 
-    gtfs_repo.get_route_shape.return_value = None
-
-    service = RouteService(bus_provider, gtfs_repo)
-
-    # Act
-    result = service.get_route_shapes([route])
-
-    # Assert
-    assert result == []
-    gtfs_repo.get_route_shape.assert_called_once_with(route)
-
-
-def test_get_route_shape_with_many_points() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-
-    route = RouteIdentifier(bus_line="long-route", bus_direction=1)
-
-    # Create a shape with many points
-    points = [
+_SHAPE_1012_10 = _shape("1012-10", 1, "84609", _POINT_A, _point(-23.5510, -46.6340, 2, 10.5))
+# The long shape is only read by the service, so build it once per module.
+# The coordinates are trusted float literals, so skip pydantic validation.
+_LONG_SHAPE = _shape(
+    "long-route",
+    1,
+    "shape_long",
+    *(
         RouteShapePoint(
-            coordinate=Coordinate(latitude=-23.5505 + i * 0.001, longitude=-46.6333 + i * 0.001),
+            coordinate=Coordinate.model_construct(
+                latitude=-23.5505 + i * 0.001, longitude=-46.6333 + i * 0.001
+            ),
             sequence=i + 1,
             distance_traveled=float(i * 10),
         )
         for i in range(100)
-    ]
-
-    mock_shape = RouteShape(route=route, shape_id="shape_long", points=points)
-
-    gtfs_repo.get_route_shape.return_value = mock_shape
-
-    service = RouteService(bus_provider, gtfs_repo)
-
-    # Act
-    result = service.get_route_shapes([route])
-
-    assert result is not None
-    assert len(result) == 1
-    assert len(result[0].points) == 100
-    assert result[0].points[0].sequence == 1
-    assert result[0].points[99].sequence == 100
-    gtfs_repo.get_route_shape.assert_called_once_with(route)
-
-
-def test_get_route_shape_with_special_characters() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-
-    route = RouteIdentifier(bus_line="route-with-special_chars@123", bus_direction=1)
-
-    mock_shape = RouteShape(
-        route=route,
-        shape_id="shape_special",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5505, longitude=-46.6333),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
+    ),
+)
+_SHAPE_8075_1 = _shape("8075", 1, "shape_8075_1", _POINT_A)
+# Same single point as _SHAPE_8075_1; only the route and shape id differ.
+_SPECIAL_SHAPE = replace(
+    _SHAPE_8075_1, route=_route("route-with-special_chars@123", 1), shape_id="shape_special"
+)
+_SHAPE_8075_2 = _shape("8075", 2, "shape_8075_2", _point(-23.5510, -46.6340))
+_SHAPE_1012_1 = _shape("1012", 1, "shape_1012_1", _point(-23.5515, -46.6345))
+
+# The GTFS repository stub answers from this table; unknown routes have no shape.
+_SHAPES_BY_ROUTE: dict[RouteIdentifier, RouteShape] = {
+    shape.route: shape
+    for shape in (
+        _SHAPE_1012_10,
+        _LONG_SHAPE,
+        _SPECIAL_SHAPE,
+        _SHAPE_8075_1,
+        _SHAPE_8075_2,
+        _SHAPE_1012_1,
     )
+}
+
+
+_BUS_POSITION_1234 = BusPosition(
+    route_id=1234,
+    position=_coordinate(-23.0, -46.0),
+    time_updated=_FIXED_TS,
+)
+_BUS_ROUTE_1234 = BusRoute(
+    route_id=1234,
+    route=_route("8075", 1),
+    is_circular=False,
+    terminal_name="Terminal A",
+)
+
+
+def _assert_same_items(result: Sequence[object], expected: Sequence[object]) -> None:
+    """Assert that the service passed the exact stubbed objects through, in order."""
+    assert [id(item) for item in result] == [id(item) for item in expected]
+
+
+class _StubBusProvider:
+    """Minimal stand-in for BusProviderPort that records calls and returns preset values."""
+
+    def __init__(
+        self,
+        positions: list[BusPosition] | None = None,
+        routes: list[BusRoute] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.calls: list[tuple[str, object]] = []
+        self._positions = positions or []
+        self._routes = routes or []
+        self._error = error
+
+    async def get_bus_positions(self, route_id: int) -> list[BusPosition]:
+        self.calls.append(("get_bus_positions", route_id))
+        if self._error is not None:
+            raise self._error
+        return self._positions
+
+    async def search_routes(self, query: str) -> list[BusRoute]:
+        self.calls.append(("search_routes", query))
+        if self._error is not None:
+            raise self._error
+        return self._routes
+
+
+@pytest.fixture
+def gtfs_repo(gtfs_repo: Mock) -> Mock:
+    gtfs_repo.get_route_shape.side_effect = _SHAPES_BY_ROUTE.get
+    return gtfs_repo
+
+
+async def test_get_bus_positions_calls_provider(
+    make_service: Callable[[BusProviderPort], RouteService],
+) -> None:
+    expected_positions: list[BusPosition] = [_BUS_POSITION_1234]
+    provider = _StubBusProvider(positions=expected_positions)
+    service: RouteService = make_service(provider)  # type: ignore[arg-type]
+
+    result: list[BusPosition] = await service.get_bus_positions([1234])
 
-    gtfs_repo.get_route_shape.return_value = mock_shape
+    assert provider.calls == [("get_bus_positions", 1234)]
+    _assert_same_items(result, expected_positions)
 
-    service = RouteService(bus_provider, gtfs_repo)
 
-    # Act
-    result = service.get_route_shapes([route])
+async def test_search_routes_calls_provider(
+    make_service: Callable[[BusProviderPort], RouteService],
+) -> None:
+    expected_routes: list[BusRoute] = [_BUS_ROUTE_1234]
+    provider = _StubBusProvider(routes=expected_routes)
+    service: RouteService = make_service(provider)  # type: ignore[arg-type]
 
-    assert result is not None
-    assert result[0].route.bus_line == "route-with-special_chars@123"
-    gtfs_repo.get_route_shape.assert_called_once_with(route)
+    query = "8075"
+    result: list[BusRoute] = await service.search_routes(query)
 
+    assert provider.calls == [("search_routes", query)]
+    assert result is expected_routes
+
+
+@pytest.mark.parametrize(
+    ("method", "argument", "provider_argument", "message"),
+    [
+        pytest.param("get_bus_positions", [1234], 1234, "boom", id="get_bus_positions"),
+        pytest.param("search_routes", "8075", "8075", "search failed", id="search_routes"),
+    ],
+)
+async def test_propagates_exception_from_provider(
+    make_service: Callable[[BusProviderPort], RouteService],
+    method: str,
+    argument: object,
+    provider_argument: object,
+    message: str,
+) -> None:
+    """Test that exceptions from the provider are propagated."""
+    provider = _StubBusProvider(error=RuntimeError(message))
+    service: RouteService = make_service(provider)  # type: ignore[arg-type]
 
-def test_get_route_shapes_multiple_routes() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
+    with pytest.raises(RuntimeError, match=message):
+        await getattr(service, method)(argument)
 
-    route1 = RouteIdentifier(bus_line="8075", bus_direction=1)
-    route2 = RouteIdentifier(bus_line="8075", bus_direction=2)
-    route3 = RouteIdentifier(bus_line="1012", bus_direction=1)
+    assert provider.calls == [(method, provider_argument)]
 
-    mock_shape1 = RouteShape(
-        route=route1,
-        shape_id="shape_8075_1",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5505, longitude=-46.6333),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
-    )
 
-    mock_shape2 = RouteShape(
-        route=route2,
-        shape_id="shape_8075_2",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5510, longitude=-46.6340),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
-    )
+@pytest.mark.parametrize(
+    ("route", "expected"),
+    [
+        pytest.param(_SHAPE_1012_10.route, [_SHAPE_1012_10], id="found"),
+        pytest.param(_route("nonexistent-route", 1), [], id="not_found"),
+        pytest.param(_LONG_SHAPE.route, [_LONG_SHAPE], id="many_points"),
+        pytest.param(_SPECIAL_SHAPE.route, [_SPECIAL_SHAPE], id="special_characters"),
+    ],
+)
+def test_get_route_shape(
+    gtfs_repo: Mock, route_service: RouteService, route: RouteIdentifier, expected: list[RouteShape]
+) -> None:
+    result = route_service.get_route_shapes([route])
 
-    mock_shape3 = RouteShape(
-        route=route3,
-        shape_id="shape_1012_1",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5515, longitude=-46.6345),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
-    )
+    _assert_same_items(result, expected)
+    assert gtfs_repo.get_route_shape.call_count == 1
+    assert gtfs_repo.get_route_shape.call_args.args[0] is route
 
-    gtfs_repo.get_route_shape.side_effect = [mock_shape1, mock_shape2, mock_shape3]
-
-    service = RouteService(bus_provider, gtfs_repo)
-
-    # Act
-    result = service.get_route_shapes([route1, route2, route3])
-
-    # Assert
-    assert len(result) == 3
-    assert result[0].route.bus_line == "8075"
-    assert result[0].route.bus_direction == 1
-    assert result[1].route.bus_line == "8075"
-    assert result[1].route.bus_direction == 2
-    assert result[2].route.bus_line == "1012"
-    assert result[2].route.bus_direction == 1
-
-
-def test_get_route_shapes_partial_results() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
-
-    route1 = RouteIdentifier(bus_line="8075", bus_direction=1)
-    route2 = RouteIdentifier(bus_line="nonexistent", bus_direction=1)
-    route3 = RouteIdentifier(bus_line="1012", bus_direction=1)
-
-    mock_shape1 = RouteShape(
-        route=route1,
-        shape_id="shape_8075_1",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5505, longitude=-46.6333),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
-    )
 
-    mock_shape3 = RouteShape(
-        route=route3,
-        shape_id="shape_1012_1",
-        points=[
-            RouteShapePoint(
-                coordinate=Coordinate(latitude=-23.5515, longitude=-46.6345),
-                sequence=1,
-                distance_traveled=0.0,
-            )
-        ],
-    )
+def test_get_route_shapes_multiple_routes(route_service: RouteService) -> None:
+    routes = [_SHAPE_8075_1.route, _SHAPE_8075_2.route, _SHAPE_1012_1.route]
 
-    # Second route returns None (not found)
-    gtfs_repo.get_route_shape.side_effect = [mock_shape1, None, mock_shape3]
+    result = route_service.get_route_shapes(routes)
 
-    service = RouteService(bus_provider, gtfs_repo)
+    _assert_same_items(result, [_SHAPE_8075_1, _SHAPE_8075_2, _SHAPE_1012_1])
 
-    # Act
-    result = service.get_route_shapes([route1, route2, route3])
 
-    # Assert - should only return 2 shapes (excluding the not found one)
-    assert len(result) == 2
-    assert result[0].route.bus_line == "8075"
-    assert result[1].route.bus_line == "1012"
+def test_get_route_shapes_partial_results(route_service: RouteService) -> None:
+    routes = [_SHAPE_8075_1.route, _route("nonexistent", 1), _SHAPE_1012_1.route]
 
+    result = route_service.get_route_shapes(routes)
 
-def test_get_route_shapes_empty_list() -> None:
-    # Arrange
-    bus_provider = create_autospec(BusProviderPort, instance=True)
-    gtfs_repo = create_autospec(GTFSRepositoryPort, instance=True)
+    # The route without a shape is left out of the result
+    _assert_same_items(result, [_SHAPE_8075_1, _SHAPE_1012_1])
 
-    service = RouteService(bus_provider, gtfs_repo)
 
-    # Act
-    result = service.get_route_shapes([])
+def test_get_route_shapes_empty_list(gtfs_repo: Mock, route_service: RouteService) -> None:
+    result = route_service.get_route_shapes([])
 
-    # Assert
     assert result == []
     gtfs_repo.get_route_shape.assert_not_called()
@@ -1,37 +1,56 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, create_autospec
+from unittest.mock import Mock
 
 import pytest
 
 from src.core.models.bus import RouteIdentifier
 from src.core.models.trip import Trip
 from src.core.models.user import User
-from src.core.ports.trip_repository import TripRepository
-from src.core.ports.user_repository import UserRepository
 from src.core.services.trip_service import TripService
 
+_NOW = datetime(2025, 11, 15, 12, 0, 0)
+_EMAIL = "user@example.com"
 
-def calculate_expected_score(distance: int) -> float:
-    return round(distance * 0.077)
 
+def _identity(trip: Trip) -> Trip:
+    """save_trip side effect that hands the trip back unchanged."""
+    return trip
 
-@pytest.mark.asyncio
-async def test_create_trip_no_user() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
 
-    user_repo.get_user_by_email = AsyncMock(return_value=None)
-    trip_repo.save_trip = AsyncMock()
-    user_repo.add_user_score = AsyncMock()
+@pytest.fixture
+def registered_user(user_repo: Mock, trip_repo: Mock) -> User:
+    """Wire the repositories for an existing user whose trips save successfully."""
+    user = User(name="Test", email=_EMAIL, score=0, password="hash")
+    user_repo.get_user_by_email.return_value = user
+    user_repo.add_user_score.return_value = user
+    trip_repo.save_trip.side_effect = _identity
+    return user
 
-    service = TripService(trip_repo, user_repo)
+
+@pytest.fixture
+def saved_trips(trip_repo: Mock) -> list[Trip]:
+    """Record every trip passed to save_trip and hand it back unchanged."""
+    saved: list[Trip] = []
+
+    async def _save_trip(trip: Trip) -> Trip:
+        saved.append(trip)
+        return trip
+
+    trip_repo.save_trip.side_effect = _save_trip
+    return saved
+
+
+async def test_create_trip_no_user(
+    user_repo: Mock, trip_repo: Mock, trip_service: TripService
+) -> None:
+    user_repo.get_user_by_email.return_value = None
 
     with pytest.raises(ValueError, match="not found"):
-        await service.create_trip(
+        await trip_service.create_trip(
             email="missing@example.com",
             route=RouteIdentifier(bus_line="8000", bus_direction=1),
             distance=1000,
-            trip_datetime=datetime.now(),
+            trip_datetime=_NOW,
         )
 
     user_repo.get_user_by_email.assert_awaited_once_with("missing@example.com")
@@ -39,141 +58,120 @@ async def test_create_trip_no_user() -> None:
     user_repo.add_user_score.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_create_trip_single_user() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
-
-    test_user = User(name="Test", email="user@example.com", score=0, password="hash")
-    user_repo.get_user_by_email = AsyncMock(return_value=test_user)
-    user_repo.add_user_score = AsyncMock(return_value=test_user)
-    trip_repo.save_trip = AsyncMock(side_effect=lambda t: t)
-
-    service = TripService(trip_repo, user_repo)
-
-    distance = 1500
-    expected_score = calculate_expected_score(distance)
-
-    trip = await service.create_trip(
-        email="user@example.com",
-        route=RouteIdentifier(bus_line="9000", bus_direction=2),
+@pytest.mark.parametrize(
+    ("distance", "bus_line", "expected_score"),
+    [
+        pytest.param(0, "0000", 0, id="zero_distance"),
+        pytest.param(1000, "8000", 77, id="one_kilometre"),
+        pytest.param(1500, "9000", 116, id="single_user"),
+        pytest.param(10_000_000, "BIG", 770_000, id="very_large_distance"),
+    ],
+)
+@pytest.mark.usefixtures("registered_user")
+async def test_create_trip_scoring(
+    user_repo: Mock,
+    trip_repo: Mock,
+    trip_service: TripService,
+    distance: int,
+    bus_line: str,
+    expected_score: int,
+) -> None:
+    trip = await trip_service.create_trip(
+        email=_EMAIL,
+        route=RouteIdentifier(bus_line=bus_line, bus_direction=2),
         distance=distance,
-        trip_datetime=datetime(2025, 11, 15, 12, 0, 0),
+        trip_datetime=_NOW,
     )
 
     assert isinstance(trip, Trip)
     assert trip.score == expected_score
-    assert trip.email == "user@example.com"
-    assert trip.route.bus_line == "9000"
-
-    user_repo.get_user_by_email.assert_awaited_once_with("user@example.com")
-    trip_repo.save_trip.assert_awaited_once()
-    user_repo.add_user_score.assert_awaited_once_with("user@example.com", expected_score)
-
-
-@pytest.mark.asyncio
-async def test_create_trip_zero_distance() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
-
-    test_user = User(name="Zero", email="zero@example.com", score=0, password="hash")
-    user_repo.get_user_by_email = AsyncMock(return_value=test_user)
-    user_repo.add_user_score = AsyncMock(return_value=test_user)
-    trip_repo.save_trip = AsyncMock(side_effect=lambda t: t)
-
-    service = TripService(trip_repo, user_repo)
-
-    trip = await service.create_trip(
-        email="zero@example.com",
-        route=RouteIdentifier(bus_line="0000", bus_direction=1),
-        distance=0,
-        trip_datetime=datetime(2025, 11, 15, 12, 0, 0),
-    )
-
-    assert isinstance(trip, Trip)
-    assert trip.score == 0.0
-    assert trip.route.bus_line == "0000"
-    user_repo.add_user_score.assert_not_awaited()
-
-
-@pytest.mark.asyncio
-async def test_create_trip_negative_distance() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
-
-    test_user = User(name="Neg", email="neg@example.com", score=0, password="hash")
-    user_repo.get_user_by_email = AsyncMock(return_value=test_user)
-    user_repo.add_user_score = AsyncMock()
-    trip_repo.save_trip = AsyncMock()
-
-    service = TripService(trip_repo, user_repo)
-
+    assert trip.email == _EMAIL
+    assert trip.route.bus_line == bus_line
+
+    user_repo.get_user_by_email.assert_awaited_once_with(_EMAIL)
+    if distance == 0:
+        # Zero-distance trips are neither saved nor scored
+        trip_repo.save_trip.assert_not_awaited()
+        user_repo.add_user_score.assert_not_awaited()
+    else:
+        trip_repo.save_trip.assert_awaited_once()
+        user_repo.add_user_score.assert_awaited_once_with(_EMAIL, expected_score)
+
+
+@pytest.mark.usefixtures("registered_user")
+async def test_create_trip_negative_distance(
+    user_repo: Mock, trip_repo: Mock, trip_service: TripService
+) -> None:
     with pytest.raises(ValueError, match="distance"):
-        await service.create_trip(
-            email="neg@example.com",
+        await trip_service.create_trip(
+            email=_EMAIL,
             route=RouteIdentifier(bus_line="-100", bus_direction=1),
             distance=-150,
-            trip_datetime=datetime(2025, 11, 15, 12, 0, 0),
+            trip_datetime=_NOW,
         )
 
     trip_repo.save_trip.assert_not_awaited()
     user_repo.add_user_score.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_create_trip_very_large_distance() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
-
-    test_user = User(name="Big", email="big@example.com", score=0, password="hash")
-    user_repo.get_user_by_email = AsyncMock(return_value=test_user)
-    user_repo.add_user_score = AsyncMock(return_value=test_user)
-    trip_repo.save_trip = AsyncMock(side_effect=lambda t: t)
-
-    service = TripService(trip_repo, user_repo)
-
-    big_distance = 10_000_000
-
-    trip = await service.create_trip(
-        email="big@example.com",
-        route=RouteIdentifier(bus_line="BIG", bus_direction=2),
-        distance=big_distance,
-        trip_datetime=datetime(2025, 11, 15, 12, 0, 0),
-    )
-
-    expected_score = calculate_expected_score(big_distance)
-    assert trip.score == expected_score
-    assert trip.route.bus_line == "BIG"
-    user_repo.add_user_score.assert_awaited_once_with("big@example.com", expected_score)
-
-
-@pytest.mark.asyncio
-async def test_create_trip_stores_route_identifier() -> None:
-    user_repo = create_autospec(UserRepository, instance=True)
-    trip_repo = create_autospec(TripRepository, instance=True)
-
+async def test_create_trip_stores_route_identifier(
+    user_repo: Mock, trip_service: TripService, saved_trips: list[Trip]
+) -> None:
     test_user = User(name="Test", email="test@example.com", score=0, password="hash")
-    user_repo.get_user_by_email = AsyncMock(return_value=test_user)
-    user_repo.add_user_score = AsyncMock(return_value=test_user)
+    user_repo.get_user_by_email.return_value = test_user
+    user_repo.add_user_score.return_value = test_user
 
-    saved_trip = None
-
-    async def capture_trip(t: Trip) -> Trip:
-        nonlocal saved_trip
-        saved_trip = t
-        return t
+    await trip_service.create_trip(
+        email="test@example.com",
+        route=RouteIdentifier(bus_line="8000", bus_direction=1),
+        distance=5000,
+        trip_datetime=_NOW,
+    )
 
-    trip_repo.save_trip = AsyncMock(side_effect=capture_trip)
+    assert len(saved_trips) == 1
+    assert saved_trips[0].route.bus_line == "8000"
+    assert saved_trips[0].route.bus_direction == 1
 
-    service = TripService(trip_repo, user_repo)
 
-    await service.create_trip(
-        email="test@example.com",
+@pytest.mark.usefixtures("registered_user")
+async def test_multiple_trips(user_repo: Mock, trip_repo: Mock, trip_service: TripService) -> None:
+    trip1 = await trip_service.create_trip(
+        email=_EMAIL,
         route=RouteIdentifier(bus_line="8000", bus_direction=1),
-        distance=5000,
-        trip_datetime=datetime(2025, 11, 15, 12, 0, 0),
+        distance=500,
+        trip_datetime=_NOW,
+    )
+
+    trip2 = await trip_service.create_trip(
+        email=_EMAIL,
+        route=RouteIdentifier(bus_line="8000", bus_direction=2),
+        distance=1500,
+        trip_datetime=_NOW,
     )
 
-    assert saved_trip is not None
-    assert saved_trip.route.bus_line == "8000"
-    assert saved_trip.route.bus_direction == 1
+    assert trip1.score == 38
+    assert trip1.route.bus_line == "8000"
+    assert trip2.score == 116
+    assert trip2.route.bus_direction == 2
+    assert trip_repo.save_trip.await_count == 2
+    assert user_repo.add_user_score.await_count == 2
+    user_repo.add_user_score.assert_any_await(_EMAIL, trip1.score)
+    user_repo.add_user_score.assert_any_await(_EMAIL, trip2.score)
+
+
+@pytest.mark.usefixtures("registered_user")
+async def test_handles_repository_save_error(
+    user_repo: Mock, trip_repo: Mock, trip_service: TripService
+) -> None:
+    trip_repo.save_trip.side_effect = RuntimeError("Database connection lost!")
+
+    with pytest.raises(RuntimeError, match="Database connection lost"):
+        await trip_service.create_trip(
+            email=_EMAIL,
+            route=RouteIdentifier(bus_line="8000", bus_direction=1),
+            distance=1000,
+            trip_datetime=_NOW,
+        )
+
+    trip_repo.save_trip.assert_awaited_once()
+    user_repo.add_user_score.assert_not_awaited()
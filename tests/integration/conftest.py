@@ -6,84 +6,137 @@ including test database setup, test client, and helper functions.
 """
 
 from collections.abc import AsyncGenerator
+from functools import cache
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.adapters.database.connection import Base, get_db
 from src.adapters.database.models import UserDB
-from src.adapters.security.hashing import PasslibPasswordHasher
+from src.adapters.security.jwt import create_access_token
+from src.core.ports.password_hasher import PasswordHasherPort
 from src.main import app
+from src.web.auth import get_password_hasher
 
-IN_MEMORY_TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+from ..conftest import make_test_engine
 
-test_engine = create_async_engine(
-    IN_MEMORY_TEST_DATABASE_URL,
-    echo=False,
-    future=True,
-)
+# Registration data of the user most integration tests act as.
+TEST_USER_DATA = {
+    "name": "Test User",
+    "email": "test@example.com",
+    "password": "securepassword123",
+}
 
-TestAsyncSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+# One engine per worker keeps the in-memory database alive for the whole
+# session, so the schema only has to be created once.
+test_engine = make_test_engine()
 
 
-async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Override database dependency for tests."""
-    async with TestAsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+class FastTestPasswordHasher(PasswordHasherPort):
+    """
+    Cheap stand-in for the bcrypt hasher.
+
+    Hash strength is not under test here, and bcrypt's deliberate cost
+    otherwise dominates every test that registers or logs in a user.
+    """
+
+    def hash(self, plain: str) -> str:
+        return f"test${plain}"
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        return hashed == f"test${plain}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def test_schema() -> AsyncGenerator[None, None]:
+    """Create the database schema once for the integration test session."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest.fixture
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Create test database tables before each test and drop them after.
+    Provide a database session whose changes are rolled back after each test.
+
+    The test and every request it makes share one outer transaction. Sessions
+    join it through SAVEPOINTs, so their commits never outlive the test.
 
     Yields:
         AsyncSession: Test database session
     """
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session_factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+            """Override database dependency for tests."""
+            async with session_factory() as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_password_hasher] = FastTestPasswordHasher
+
+        try:
+            async with session_factory() as session:
+                yield session
+        finally:
+            app.dependency_overrides.clear()
+            await trans.rollback()
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    async with TestAsyncSessionLocal() as session:
-        yield session
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create one HTTP client into the application for the whole session.
 
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    The app never sets cookies and tests pass auth headers per request, so the
+    client carries no state between tests; per-test isolation comes from the
+    dependency overrides installed by ``test_db``.
 
-    app.dependency_overrides.clear()
+    Yields:
+        AsyncClient: Shared HTTP client
+    """
+    transport = ASGITransport(app=app)  # type: ignore[arg-type]
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
-async def client(
+def client(
     test_db: AsyncSession,
     set_sptrans_api_token: None,  # through this dependency we ensure the fake token is set
-) -> AsyncGenerator[AsyncClient, None]:
+    http_client: AsyncClient,
+) -> AsyncClient:
     """
-    Create test HTTP client.
+    Provide the test HTTP client with the database and token set up.
 
     Args:
         test_db: Test database session (ensures DB is set up)
+        http_client: Shared HTTP client
 
-    Yields:
+    Returns:
         AsyncClient: HTTP client for testing
     """
-    transport = ASGITransport(app=app)  # type: ignore[arg-type]
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    return http_client
 
 
 @pytest.fixture
@@ -101,36 +154,60 @@ def set_sptrans_api_token(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
+@cache
+def _access_token(email: str) -> str:
+    """
+    Sign a login token for ``email`` once per session.
+
+    The token only carries the email and a week-long expiry, so it stays valid
+    for users recreated by later tests after earlier rows were rolled back.
+    """
+    return create_access_token(data={"sub": email})
+
+
+@pytest.fixture
+async def logged_in_user(test_db: AsyncSession) -> dict[str, Any]:
+    """
+    Create the default test user and return its token info.
+
+    Function-scoped on purpose: the user row lives in the test's transaction
+    and is rolled back with it.
+
+    Returns:
+        dict: Contains access_token, headers and user info
+    """
+    return await create_user_and_login(test_db, TEST_USER_DATA)
+
+
 async def create_user_and_login(
-    client: AsyncClient,
+    session: AsyncSession,
     user_data: dict[str, str],
 ) -> dict[str, Any]:
     """
     Helper to create a user and login, returning token info.
 
+    The user is inserted directly and the token minted the same way the login
+    endpoint does, so tests that only need an authenticated caller skip the
+    register and login round trips. Tests of those endpoints call them directly.
+
     Args:
-        client: HTTP client
+        session: Database session
         user_data: User registration data
 
     Returns:
         dict: Contains access_token and user info
     """
-    # Register user
-    await client.post("/users/register", json=user_data)
-
-    # Login
-    login_response = await client.post(
-        "/users/login",
-        data={
-            "username": user_data["email"],
-            "password": user_data["password"],
-        },
+    await create_test_user_in_db(
+        session,
+        user_data["email"],
+        password=user_data["password"],
+        name=user_data["name"],
     )
-    token_data = login_response.json()
+    access_token = _access_token(user_data["email"])
 
     return {
-        "access_token": token_data["access_token"],
-        "headers": {"Authorization": f"Bearer {token_data['access_token']}"},
+        "access_token": access_token,
+        "headers": {"Authorization": f"Bearer {access_token}"},
         "user": user_data,
     }
 
@@ -140,6 +217,7 @@ async def create_test_user_in_db(
     email: str,
     score: int = 0,
     password: str = "password123",
+    name: str | None = None,
 ) -> UserDB:
     """
     Helper to create a user directly in the database.
@@ -149,15 +227,15 @@ async def create_test_user_in_db(
         email: User email
         score: User score
         password: User password
+        name: User name, derived from the email when omitted
 
     Returns:
         UserDB: Created user object
     """
-    hasher = PasslibPasswordHasher()
-    hashed_password = hasher.hash(password)
+    hashed_password = FastTestPasswordHasher().hash(password)
 
     user = UserDB(
-        name=email.split("@")[0],
+        name=name or email.split("@")[0],
         email=email,
         password=hashed_password,
         score=score,
@@ -166,3 +244,30 @@ async def create_test_user_in_db(
     await session.commit()
     await session.refresh(user)
     return user
+
+
+async def create_test_users_in_db(
+    session: AsyncSession,
+    users: list[tuple[str, int]],
+    password: str = "password123",
+) -> list[UserDB]:
+    """
+    Helper to create several users directly in the database with one commit.
+
+    Args:
+        session: Database session
+        users: (email, score) pairs
+        password: Password shared by every user
+
+    Returns:
+        list[UserDB]: Created user objects
+    """
+    hashed_password = FastTestPasswordHasher().hash(password)
+
+    created = [
+        UserDB(name=email.split("@")[0], email=email, password=hashed_password, score=score)
+        for email, score in users
+    ]
+    session.add_all(created)
+    await session.commit()
+    return created
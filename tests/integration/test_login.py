@@ -1,11 +1,9 @@
-import pytest
-from httpx import AsyncClient
+from typing import Any
 
-from .conftest import create_user_and_login
+from httpx import AsyncClient
 
 
 class TestUserRegistration:
-    @pytest.mark.asyncio
     async def test_create_account_should_work(
         self,
         client: AsyncClient,
@@ -25,7 +23,6 @@ class TestUserRegistration:
         assert data["score"] == 0
         assert "password" not in data
 
-    @pytest.mark.asyncio
     async def test_create_account_duplicate_email_fails(
         self,
         client: AsyncClient,
@@ -41,7 +38,6 @@ class TestUserRegistration:
         response2 = await client.post("/users/register", json=user_data)
         assert response2.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_create_account_invalid_email_fails(
         self,
         client: AsyncClient,
@@ -54,7 +50,6 @@ class TestUserRegistration:
         response = await client.post("/users/register", json=invalid_data)
         assert response.status_code == 422  # Validation error
 
-    @pytest.mark.asyncio
     async def test_create_account_short_password_fails(
         self,
         client: AsyncClient,
@@ -69,7 +64,6 @@ class TestUserRegistration:
 
 
 class TestUserLogin:
-    @pytest.mark.asyncio
     async def test_login_should_work(
         self,
         client: AsyncClient,
@@ -99,7 +93,6 @@ class TestUserLogin:
         assert data["token_type"] == "bearer"
         assert len(data["access_token"]) > 0
 
-    @pytest.mark.asyncio
     async def test_login_wrong_password_fails(
         self,
         client: AsyncClient,
@@ -125,7 +118,6 @@ class TestUserLogin:
         assert response.status_code == 401
         assert "Invalid email or password" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_login_nonexistent_user_fails(
         self,
         client: AsyncClient,
@@ -142,28 +134,20 @@ class TestUserLogin:
 
 
 class TestGetUserInfo:
-    @pytest.mark.asyncio
     async def test_get_user_info_should_work(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        response = await client.get("/users/me", headers=auth["headers"])
+        response = await client.get("/users/me", headers=logged_in_user["headers"])
 
         assert response.status_code == 200
         data = response.json()
 
-        assert data["name"] == user_data["name"]
-        assert data["email"] == user_data["email"]
+        assert data["name"] == logged_in_user["user"]["name"]
+        assert data["email"] == logged_in_user["user"]["email"]
         assert data["score"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_user_info_without_token_fails(
         self,
         client: AsyncClient,
@@ -172,7 +156,6 @@ class TestGetUserInfo:
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_get_user_info_invalid_token_fails(
         self,
         client: AsyncClient,
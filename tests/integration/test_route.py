@@ -1,193 +1,149 @@
+from collections.abc import Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from httpx import AsyncClient
 
+from src.adapters.external.sptrans_adapter import SpTransAdapter
 from src.core.models.bus import BusPosition, BusRoute, RouteIdentifier
 from src.core.models.coordinate import Coordinate
-from src.web.schemas import (
-    BusPositionsRequest,
-    BusRouteRequestSchema,
+
+_NOW = datetime(2025, 11, 15, 12, 0, 0, tzinfo=UTC)
+
+_ROUTE_8000_1 = BusRoute(
+    route_id=12345,
+    route=RouteIdentifier(bus_line="8000", bus_direction=1),
+    is_circular=False,
+    terminal_name="Terminal A",
+)
+_ROUTE_8000_2 = BusRoute(
+    route_id=12346,
+    route=RouteIdentifier(bus_line="8000", bus_direction=2),
+    is_circular=False,
+    terminal_name="Terminal B",
 )
 
-from .conftest import create_user_and_login
+_POSITIONS_BY_ROUTE: dict[int, list[BusPosition]] = {
+    12345: [
+        BusPosition(
+            route_id=12345,
+            position=Coordinate(latitude=-23.550520, longitude=-46.633308),
+            time_updated=_NOW,
+        ),
+        BusPosition(
+            route_id=12345,
+            position=Coordinate(latitude=-23.551234, longitude=-46.634567),
+            time_updated=_NOW,
+        ),
+    ],
+    67890: [
+        BusPosition(
+            route_id=67890,
+            position=Coordinate(latitude=-23.560520, longitude=-46.643308),
+            time_updated=_NOW,
+        ),
+    ],
+}
+
+# Request bodies shared by several tests
+_POSITIONS_REQUEST = {"routes": [{"route_id": 12345}]}
+_SHAPE_REQUEST = {"routes": [{"bus_line": "1012-10", "bus_direction": 1}]}
+
+
+def _positions_for(route_id: int) -> list[BusPosition]:
+    return _POSITIONS_BY_ROUTE.get(route_id, [])
+
+
+@pytest.fixture(scope="module")
+def _sptrans_mocks() -> Generator[SimpleNamespace, None, None]:
+    """Install AsyncMocks over the SPTrans adapter's network calls once per module."""
+    mocks = SimpleNamespace(search_routes=AsyncMock(), get_bus_positions=AsyncMock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(SpTransAdapter, "search_routes", mocks.search_routes)
+        mp.setattr(SpTransAdapter, "get_bus_positions", mocks.get_bus_positions)
+        yield mocks
+
+
+@pytest.fixture
+def sptrans(_sptrans_mocks: SimpleNamespace) -> SimpleNamespace:
+    """
+    Hand out the SPTrans mocks reset to return no results.
+
+    Tests set return_value or side_effect on them as needed.
+    """
+    for mock in vars(_sptrans_mocks).values():
+        mock.reset_mock(side_effect=True)
+        mock.return_value = []
+    return _sptrans_mocks
 
 
 class TestRouteSearch:
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("query", "routes"),
+        [
+            pytest.param("8000", [_ROUTE_8000_1], id="single_result"),
+            pytest.param("8000", [_ROUTE_8000_1, _ROUTE_8000_2], id="multiple_results"),
+            pytest.param("UNKNOWN", [], id="unknown_query"),
+        ],
+    )
     async def test_search_routes_returns_successfully(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
+        sptrans: SimpleNamespace,
+        query: str,
+        routes: list[BusRoute],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        mock_bus_routes = [
-            BusRoute(
-                route_id=12345,
-                route=RouteIdentifier(
-                    bus_line="8000",
-                    bus_direction=1,
-                ),
-                is_circular=False,
-                terminal_name="Terminal A",
-            )
-        ]
+        sptrans.search_routes.return_value = routes
 
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.search_routes",
-            new_callable=AsyncMock,
-            return_value=mock_bus_routes,
-        ):
-            response = await client.get(
-                "/routes/search",
-                params={"query": "8000"},
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert "routes" in data
-            assert len(data["routes"]) == 1
-
-            first_route = data["routes"][0]
-            assert "route_id" in first_route
-            assert first_route["route_id"] == 12345
-            assert "route" in first_route
-            assert first_route["route"]["bus_line"] == "8000"
-            assert first_route["route"]["bus_direction"] == 1
-
-    @pytest.mark.asyncio
-    async def test_search_routes_returns_multiple_results(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        mock_bus_routes = [
-            BusRoute(
-                route_id=12345,
-                route=RouteIdentifier(
-                    bus_line="8000",
-                    bus_direction=1,
-                ),
-                is_circular=False,
-                terminal_name="Terminal A",
-            ),
-            BusRoute(
-                route_id=12346,
-                route=RouteIdentifier(
-                    bus_line="8000",
-                    bus_direction=2,
-                ),
-                is_circular=False,
-                terminal_name="Terminal B",
-            ),
+        response = await client.get(
+            "/routes/search",
+            params={"query": query},
+            headers=logged_in_user["headers"],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert "routes" in data
+        assert [r["route_id"] for r in data["routes"]] == [r.route_id for r in routes]
+        assert [(r["route"]["bus_line"], r["route"]["bus_direction"]) for r in data["routes"]] == [
+            (r.route.bus_line, r.route.bus_direction) for r in routes
         ]
+        sptrans.search_routes.assert_awaited_once_with(query)
 
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.search_routes",
-            new_callable=AsyncMock,
-            return_value=mock_bus_routes,
-        ):
-            response = await client.get(
-                "/routes/search",
-                params={"query": "8000"},
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert len(data["routes"]) == 2
-            route_ids = [r["route_id"] for r in data["routes"]]
-            assert 12345 in route_ids
-            assert 12346 in route_ids
-
-    @pytest.mark.asyncio
-    async def test_search_routes_returns_empty_for_unknown_query(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.search_routes",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            response = await client.get(
-                "/routes/search",
-                params={"query": "UNKNOWN"},
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["routes"] == []
-
-    @pytest.mark.asyncio
     async def test_search_routes_returns_500_on_api_error(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
+        sptrans: SimpleNamespace,
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.search_routes",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("API unavailable"),
-        ):
-            response = await client.get(
-                "/routes/search",
-                params={"query": "8000"},
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 500
-            assert "Failed to search routes" in response.json()["detail"]
-
-    @pytest.mark.asyncio
+        sptrans.search_routes.side_effect = RuntimeError("API unavailable")
+
+        response = await client.get(
+            "/routes/search",
+            params={"query": "8000"},
+            headers=logged_in_user["headers"],
+        )
+
+        assert response.status_code == 500
+        assert "Failed to search routes" in response.json()["detail"]
+
     async def test_search_routes_returns_422_when_query_missing(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         response = await client.get(
             "/routes/search",
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_search_routes_without_auth_fails(
         self,
         client: AsyncClient,
@@ -198,232 +154,71 @@ class TestRouteSearch:
 
 
 class TestBusPositions:
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("route_ids", "expected_route_ids"),
+        [
+            pytest.param([12345], [12345, 12345], id="single_route"),
+            pytest.param([12345, 67890], [12345, 12345, 67890], id="multiple_routes"),
+            pytest.param([99999], [], id="no_buses_on_line"),
+            pytest.param([], [], id="empty_routes_list"),
+        ],
+    )
     async def test_get_bus_position_returns_successfully(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
+        sptrans: SimpleNamespace,
+        route_ids: list[int],
+        expected_route_ids: list[int],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        mock_positions = [
-            BusPosition(
-                route_id=12345,
-                position=Coordinate(latitude=-23.550520, longitude=-46.633308),
-                time_updated=datetime.now(UTC),
-            ),
-            BusPosition(
-                route_id=12345,
-                position=Coordinate(latitude=-23.551234, longitude=-46.634567),
-                time_updated=datetime.now(UTC),
-            ),
-        ]
+        sptrans.get_bus_positions.side_effect = _positions_for
 
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            return_value=mock_positions,
-        ):
-            request_data = BusPositionsRequest(
-                routes=[
-                    BusRouteRequestSchema(route_id=12345),
-                ]
-            )
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert "buses" in data
-            assert len(data["buses"]) == 2
-
-            first_bus = data["buses"][0]
-            assert "route_id" in first_bus
-            assert first_bus["route_id"] == 12345
-            assert "position" in first_bus
-            assert "latitude" in first_bus["position"]
-            assert "longitude" in first_bus["position"]
-            assert "time_updated" in first_bus
-
-    @pytest.mark.asyncio
+        response = await client.post(
+            "/routes/positions",
+            json={"routes": [{"route_id": route_id} for route_id in route_ids]},
+            headers=logged_in_user["headers"],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert "buses" in data
+        assert [bus["route_id"] for bus in data["buses"]] == expected_route_ids
+        for bus in data["buses"]:
+            assert "latitude" in bus["position"]
+            assert "longitude" in bus["position"]
+            assert "time_updated" in bus
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(ValueError("Error fetching positions"), id="value_error"),
+            pytest.param(RuntimeError("API error"), id="runtime_error"),
+        ],
+    )
     async def test_get_bus_position_returns_500_when_error(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
+        sptrans: SimpleNamespace,
+        error: Exception,
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            side_effect=ValueError("Error fetching positions"),
-        ):
-            request_data = BusPositionsRequest(
-                routes=[
-                    BusRouteRequestSchema(route_id=99999),
-                ]
-            )
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 500
-            assert "Failed to retrieve bus positions" in response.json()["detail"]
-
-    @pytest.mark.asyncio
-    async def test_get_bus_position_returns_empty_when_no_buses_on_line(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            request_data = BusPositionsRequest(
-                routes=[
-                    BusRouteRequestSchema(route_id=12345),
-                ]
-            )
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert "buses" in data
-            assert len(data["buses"]) == 0
-
-    @pytest.mark.asyncio
-    async def test_get_bus_position_works_with_multiple_routes(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        mock_position_12345 = [
-            BusPosition(
-                route_id=12345,
-                position=Coordinate(latitude=-23.550520, longitude=-46.633308),
-                time_updated=datetime.now(UTC),
-            ),
-        ]
-        mock_position_67890 = [
-            BusPosition(
-                route_id=67890,
-                position=Coordinate(latitude=-23.560520, longitude=-46.643308),
-                time_updated=datetime.now(UTC),
-            ),
-        ]
+        sptrans.get_bus_positions.side_effect = error
+
+        response = await client.post(
+            "/routes/positions",
+            json=_POSITIONS_REQUEST,
+            headers=logged_in_user["headers"],
+        )
+
+        assert response.status_code == 500
+        assert "Failed to retrieve bus positions" in response.json()["detail"]
 
-        def mock_get_positions(route_id: int) -> list[BusPosition]:
-            if route_id == 12345:
-                return mock_position_12345
-            elif route_id == 67890:
-                return mock_position_67890
-            return []
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            side_effect=mock_get_positions,
-        ):
-            request_data = BusPositionsRequest(
-                routes=[
-                    BusRouteRequestSchema(route_id=12345),
-                    BusRouteRequestSchema(route_id=67890),
-                ]
-            )
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert len(data["buses"]) == 2
-            route_ids = [bus["route_id"] for bus in data["buses"]]
-            assert 12345 in route_ids
-            assert 67890 in route_ids
-
-    @pytest.mark.asyncio
-    async def test_get_bus_position_returns_500_when_api_error(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("API error"),
-        ):
-            request_data = BusPositionsRequest(
-                routes=[
-                    BusRouteRequestSchema(route_id=12345),
-                ]
-            )
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 500
-
-    @pytest.mark.asyncio
     async def test_get_bus_position_returns_422_when_invalid_data(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         invalid_request_data: dict[str, list[dict[str, str]]] = {
             "routes": [{"route_id": "not_an_int"}]
         }
@@ -431,74 +226,30 @@ class TestBusPositions:
         response = await client.post(
             "/routes/positions",
             json=invalid_request_data,
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
-    async def test_get_bus_position_returns_successfully_with_empty_routes_list(
-        self,
-        client: AsyncClient,
-    ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        with patch(
-            "src.adapters.external.sptrans_adapter.SpTransAdapter.get_bus_positions",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            request_data = BusPositionsRequest(routes=[])
-
-            response = await client.post(
-                "/routes/positions",
-                json=request_data.model_dump(),
-                headers=auth["headers"],
-            )
-
-            assert response.status_code == 200
-            assert response.json()["buses"] == []
-
-    @pytest.mark.asyncio
     async def test_get_bus_position_without_auth_fails(
         self,
         client: AsyncClient,
     ) -> None:
-        request_data = BusPositionsRequest(
-            routes=[
-                BusRouteRequestSchema(route_id=12345),
-            ]
-        )
-
-        response = await client.post("/routes/positions", json=request_data.model_dump())
+        response = await client.post("/routes/positions", json=_POSITIONS_REQUEST)
 
         assert response.status_code == 401
 
 
 class TestRouteShapes:
-    @pytest.mark.asyncio
     async def test_get_route_shapes_returns_successfully(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        request_data = {"routes": [{"bus_line": "1012-10", "bus_direction": 1}]}
-
         response = await client.post(
             "/routes/shapes",
-            json=request_data,
-            headers=auth["headers"],
+            json=_SHAPE_REQUEST,
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -521,42 +272,28 @@ class TestRouteShapes:
         assert isinstance(first_point["latitude"], float)
         assert isinstance(first_point["longitude"], float)
 
-    @pytest.mark.asyncio
     async def test_get_route_shapes_returns_empty_when_not_found(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         request_data = {"routes": [{"bus_line": "NONEXISTENT-ROUTE-12345", "bus_direction": 1}]}
 
         response = await client.post(
             "/routes/shapes",
             json=request_data,
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["shapes"] == []
 
-    @pytest.mark.asyncio
     async def test_get_route_shapes_multiple_routes(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         request_data = {
             "routes": [
                 {"bus_line": "1012-10", "bus_direction": 1},
@@ -567,7 +304,7 @@ class TestRouteShapes:
         response = await client.post(
             "/routes/shapes",
             json=request_data,
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -576,24 +313,15 @@ class TestRouteShapes:
         # Should return shapes for routes that exist
         assert "shapes" in data
 
-    @pytest.mark.asyncio
     async def test_get_route_shapes_points_have_valid_coordinates(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
-        request_data = {"routes": [{"bus_line": "1012-10", "bus_direction": 1}]}
-
         response = await client.post(
             "/routes/shapes",
-            json=request_data,
-            headers=auth["headers"],
+            json=_SHAPE_REQUEST,
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -601,41 +329,30 @@ class TestRouteShapes:
 
         if data["shapes"]:
             points = data["shapes"][0]["points"]
-            for point in points:
-                # São Paulo coordinates range
-                assert -25 <= point["latitude"] <= -22
-                assert -48 <= point["longitude"] <= -45
+            # São Paulo coordinates range
+            assert all(-25 <= point["latitude"] <= -22 for point in points)
+            assert all(-48 <= point["longitude"] <= -45 for point in points)
 
-    @pytest.mark.asyncio
     async def test_get_route_shapes_without_auth_fails(
         self,
         client: AsyncClient,
     ) -> None:
-        request_data = {"routes": [{"bus_line": "1012-10", "bus_direction": 1}]}
-
-        response = await client.post("/routes/shapes", json=request_data)
+        response = await client.post("/routes/shapes", json=_SHAPE_REQUEST)
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_get_route_shapes_default_direction(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         # Request without bus_direction (should default to 1)
         request_data = {"routes": [{"bus_line": "1012-10"}]}
 
         response = await client.post(
             "/routes/shapes",
             json=request_data,
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
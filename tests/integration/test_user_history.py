@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
+from typing import Any
 
-import pytest
 from httpx import AsyncClient
 
 from src.web.schemas import (
@@ -9,22 +9,13 @@ from src.web.schemas import (
     RouteIdentifierSchema,
 )
 
-from .conftest import create_user_and_login
-
 
 class TestUserHistory:
-    @pytest.mark.asyncio
     async def test_get_user_history_should_work(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-        auth = await create_user_and_login(client, user_data)
-
         trip_dates: list[datetime] = [
             datetime(2025, 11, 1, 8, 0, 0, tzinfo=UTC),
             datetime(2025, 11, 15, 12, 0, 0, tzinfo=UTC),
@@ -41,13 +32,13 @@ class TestUserHistory:
             response = await client.post(
                 "/trips/",
                 json=trip_request.model_dump(mode="json"),
-                headers=auth["headers"],
+                headers=logged_in_user["headers"],
             )
             scores.append(response.json()["score"])
 
         response = await client.get(
             "/history/",
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -61,22 +52,14 @@ class TestUserHistory:
 
         assert sorted(scores) == sorted([trip.score for trip in history_response.trips])
 
-    @pytest.mark.asyncio
     async def test_get_user_history_returns_empty_when_no_trips(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "secure_password_123",
-        }
-
-        auth = await create_user_and_login(client, user_data)
-
         response = await client.get(
             "/history/",
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -84,7 +67,6 @@ class TestUserHistory:
         assert isinstance(history_response.trips, list)
         assert len(history_response.trips) == 0
 
-    @pytest.mark.asyncio
     async def test_get_user_history_without_authentication_fails(
         self,
         client: AsyncClient,
@@ -93,19 +75,11 @@ class TestUserHistory:
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_get_history_includes_correct_dates(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-
-        auth = await create_user_and_login(client, user_data)
-
         specific_date: datetime = datetime(2025, 6, 15, 10, 30, 0, tzinfo=UTC)
         trip_request = CreateTripRequest(
             route=RouteIdentifierSchema(bus_line="8000", bus_direction=1),
@@ -115,12 +89,12 @@ class TestUserHistory:
         await client.post(
             "/trips/",
             json=trip_request.model_dump(mode="json"),
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         response = await client.get(
             "/history/",
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
@@ -131,19 +105,11 @@ class TestUserHistory:
         assert trip_datetime.month == 6
         assert trip_datetime.day == 15
 
-    @pytest.mark.asyncio
     async def test_get_history_includes_route_identifier(
         self,
         client: AsyncClient,
+        logged_in_user: dict[str, Any],
     ) -> None:
-        user_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "password": "securepassword123",
-        }
-
-        auth = await create_user_and_login(client, user_data)
-
         bus_line = "8000"
         bus_direction = 2
         trip_request = CreateTripRequest(
@@ -154,12 +120,12 @@ class TestUserHistory:
         await client.post(
             "/trips/",
             json=trip_request.model_dump(mode="json"),
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         response = await client.get(
             "/history/",
-            headers=auth["headers"],
+            headers=logged_in_user["headers"],
         )
 
         assert response.status_code == 200
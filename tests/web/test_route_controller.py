@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import create_autospec
 
 import pytest
 from fastapi.testclient import TestClient
@@ -24,12 +24,10 @@ def client() -> TestClient:
 
 @pytest.fixture
 def mock_service() -> RouteService:
-    service = AsyncMock(spec=RouteService)
-    typed_service: RouteService = service
-    typed_service.search_routes = AsyncMock()  # type: ignore[method-assign]
-    typed_service.get_bus_positions = AsyncMock()  # type: ignore[method-assign]
-    typed_service.get_route_shapes = Mock()  # type: ignore[method-assign]
-    return typed_service
+    # Autospec mirrors the service: coroutine methods become AsyncMock and
+    # get_route_shapes stays a plain synchronous mock.
+    service: RouteService = create_autospec(RouteService, instance=True)
+    return service
 
 
 @pytest.fixture
@@ -48,7 +46,6 @@ def override_dependency(
 
 
 class TestSearchRoutes:
-    @pytest.mark.asyncio
     async def test_search_endpoint_success(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -93,7 +90,6 @@ class TestSearchRoutes:
         called_arg = mock_service.search_routes.await_args.args[0]  # type: ignore[attr-defined]
         assert called_arg == "8075"
 
-    @pytest.mark.asyncio
     async def test_search_endpoint_with_destination_name(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -123,7 +119,6 @@ class TestSearchRoutes:
         called_arg = mock_service.search_routes.await_args.args[0]  # type: ignore[attr-defined]
         assert called_arg == "Vila Nova Conceição"
 
-    @pytest.mark.asyncio
     async def test_search_endpoint_empty_results(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -136,7 +131,6 @@ class TestSearchRoutes:
         data = response.json()
         assert data["routes"] == []
 
-    @pytest.mark.asyncio
     async def test_search_endpoint_error_returns_500(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -153,7 +147,6 @@ class TestSearchRoutes:
 class TestBusPositions:
     """Tests for the /routes/positions endpoint."""
 
-    @pytest.mark.asyncio
     async def test_positions_endpoint_success(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -190,7 +183,6 @@ class TestBusPositions:
         route_ids = called_args[0]
         assert route_ids == [2044]
 
-    @pytest.mark.asyncio
     async def test_positions_endpoint_multiple_routes(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -223,7 +215,6 @@ class TestBusPositions:
         assert len(data["buses"]) == 2
         mock_service.get_bus_positions.assert_awaited_once()  # type: ignore[attr-defined]
 
-    @pytest.mark.asyncio
     async def test_positions_endpoint_error_returns_500(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -238,7 +229,6 @@ class TestBusPositions:
         body = response.json()
         assert "Failed to retrieve bus positions" in body["detail"]
 
-    @pytest.mark.asyncio
     async def test_positions_endpoint_empty_routes(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -257,7 +247,6 @@ class TestBusPositions:
 # /routes/shapes
 # =========================
 class TestRouteShapes:
-    @pytest.mark.asyncio
     async def test_shapes_endpoint_success(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -340,7 +329,6 @@ class TestRouteShapes:
         assert called_args[1].bus_line == "8075"
         assert called_args[1].bus_direction == 2
 
-    @pytest.mark.asyncio
     async def test_shapes_endpoint_single_route(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -378,7 +366,6 @@ class TestRouteShapes:
         assert data["shapes"][0]["route"]["bus_line"] == "1012"
         assert data["shapes"][0]["route"]["bus_direction"] == 1
 
-    @pytest.mark.asyncio
     async def test_shapes_endpoint_empty_result(
         self, client: TestClient, mock_service: RouteService
     ) -> None:
@@ -398,7 +385,6 @@ class TestRouteShapes:
         data = response.json()
         assert data["shapes"] == []
 
-    @pytest.mark.asyncio
     async def test_shapes_endpoint_error_returns_500(
         self, client: TestClient, mock_service: RouteService
     ) -> None: